@@ -2,11 +2,15 @@
 
 import asyncio
 import builtins
+import contextlib
 import fnmatch
+import glob
 import hashlib
 import json
 import os
+import time
 import typing
+import uuid
 from urllib.parse import urlparse
 
 import httpx
@@ -74,6 +78,9 @@ def set_handlers(
 
         .. note:: ``huggingface_hub`` package should be present for automatic models fetching.
 
+        .. note:: Files downloaded by URL get a ``<file>.etag`` file next to them,
+            so on the next start they are not hashed again to check if they are up to date.
+
     :param map_app_static: Should be folders ``js``, ``css``, ``l10n``, ``img`` automatically mounted in FastAPI or not.
 
         .. note:: First, presence of these directories in the current working dir is checked, then one directory higher.
@@ -125,29 +132,34 @@ def fetch_models_task(nc: NextcloudApp, models: dict[str, dict], progress_init_s
     if models:
         current_progress = progress_init_start_value
         percent_for_each = min(int((100 - progress_init_start_value) / len(models)), 99)
-        for model in models:
-            if model.startswith(("http://", "https://")):
-                models[model]["path"] = __fetch_model_as_file(
-                    current_progress, percent_for_each, nc, model, models[model]
-                )
-            else:
-                models[model]["path"] = __fetch_model_as_snapshot(
-                    current_progress, percent_for_each, nc, model, models[model]
-                )
-            current_progress += percent_for_each
+        with httpx.Client(follow_redirects=True) as client:  # models from the same host reuse the connection
+            for model in models:
+                if model.startswith(("http://", "https://")):
+                    models[model]["path"] = __fetch_model_as_file(
+                        client, current_progress, percent_for_each, nc, model, models[model]
+                    )
+                else:
+                    models[model]["path"] = __fetch_model_as_snapshot(
+                        current_progress, percent_for_each, nc, model, models[model]
+                    )
+                current_progress += percent_for_each
     nc.set_init_status(100)
 
 
 def __fetch_model_as_file(
-    current_progress: int, progress_for_task: int, nc: NextcloudApp, model_path: str, download_options: dict
+    client: httpx.Client,
+    current_progress: int,
+    progress_for_task: int,
+    nc: NextcloudApp,
+    model_path: str,
+    download_options: dict,
 ) -> str | None:
     result_path = download_options.pop("save_path", urlparse(model_path).path.split("/")[-1])
     try:
-        with httpx.stream("GET", model_path, follow_redirects=True) as response:
+        with client.stream("GET", model_path) as response:
             if not response.is_success:
                 nc.log(LogLvl.ERROR, f"Downloading of '{model_path}' returned {response.status_code} status.")
                 return None
-            downloaded_size = 0
             linked_etag = ""
             for each_history in response.history:
                 linked_etag = each_history.headers.get("X-Linked-ETag", "")
@@ -160,24 +172,17 @@ def __fetch_model_as_file(
                 existing_size = os.path.getsize(result_path)
             except OSError:
                 existing_size = 0
-            if linked_etag and total_size == existing_size:
-                with builtins.open(result_path, "rb") as file:
-                    sha256_hash = hashlib.sha256()
-                    for byte_block in iter(lambda: file.read(4096), b""):
-                        sha256_hash.update(byte_block)
-                    if f'"{sha256_hash.hexdigest()}"' == linked_etag:
-                        nc.set_init_status(min(current_progress + progress_for_task, 99))
-                        return None
-
-            with builtins.open(result_path, "wb") as file:
-                last_progress = current_progress
-                for chunk in response.iter_bytes(5 * 1024 * 1024):
-                    downloaded_size += file.write(chunk)
-                    if total_size:
-                        new_progress = min(current_progress + int(progress_for_task * downloaded_size / total_size), 99)
-                        if new_progress != last_progress:
-                            nc.set_init_status(new_progress)
-                            last_progress = new_progress
+            if linked_etag and total_size == existing_size and __file_matches_etag(result_path, linked_etag):
+                nc.set_init_status(min(current_progress + progress_for_task, 99))
+                return None
+
+            with contextlib.suppress(OSError):
+                os.remove(f"{result_path}.etag")
+            sha256_digest = __download_to_file(
+                response, result_path, total_size, current_progress, progress_for_task, nc
+            )
+            if linked_etag and f'"{sha256_digest}"' == linked_etag:
+                __save_etag(result_path, linked_etag)
 
         return result_path
     except Exception as e:  # noqa pylint: disable=broad-exception-caught
@@ -186,6 +191,77 @@ def __fetch_model_as_file(
     return None
 
 
+def __download_to_file(
+    response: httpx.Response,
+    result_path: str,
+    total_size: int,
+    current_progress: int,
+    progress_for_task: int,
+    nc: NextcloudApp,
+) -> str:
+    """Streams the response body to ``result_path`` and returns its SHA-256 digest."""
+    downloaded_size = 0
+    sha256_hash = hashlib.sha256()
+    # an interrupted download must never be left under the name of a complete model, and
+    # a name of its own keeps a concurrent `/init` for the same model from writing into it
+    tmp_path = f"{result_path}.{uuid.uuid4().hex}.tmp"
+    __remove_stale_downloads(result_path)
+    last_progress = current_progress
+    last_progress_time = 0.0
+    try:
+        with builtins.open(tmp_path, "wb") as file:
+            for chunk in response.iter_bytes(5 * 1024 * 1024):
+                downloaded_size += file.write(chunk)
+                sha256_hash.update(chunk)
+                if total_size:
+                    new_progress = min(current_progress + progress_for_task * downloaded_size // total_size, 99)
+                    # each update is a request to Nextcloud that blocks the download, so send at most one per second
+                    if new_progress != last_progress and time.monotonic() - last_progress_time >= 1.0:
+                        nc.set_init_status(new_progress)
+                        last_progress = new_progress
+                        last_progress_time = time.monotonic()
+        os.replace(tmp_path, result_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    # the throttle above can swallow the last updates, so always report the finished task
+    final_progress = min(current_progress + progress_for_task, 99)
+    if final_progress != last_progress:
+        nc.set_init_status(final_progress)
+    return sha256_hash.hexdigest()
+
+
+def __remove_stale_downloads(result_path: str) -> None:
+    """Removes temporary files of downloads that were killed before they could clean up."""
+    for tmp_path in glob.glob(glob.escape(result_path) + "." + "[0-9a-f]" * 32 + ".tmp"):
+        with contextlib.suppress(OSError):
+            # an active download writes every few seconds, so an old file has no writer left
+            if time.time() - os.path.getmtime(tmp_path) > 600:
+                os.remove(tmp_path)
+
+
+def __file_matches_etag(file_path: str, etag: str) -> bool:
+    """Compares the file with the ETag saved after its last check, hashing the whole file only if there is none."""
+    with contextlib.suppress(OSError):
+        if os.path.getmtime(f"{file_path}.etag") >= os.path.getmtime(file_path):
+            with builtins.open(f"{file_path}.etag", encoding="utf-8") as etag_file:
+                return etag_file.read() == etag
+    with builtins.open(file_path, "rb") as file:
+        sha256_hash = hashlib.sha256()
+        for byte_block in iter(lambda: file.read(1024 * 1024), b""):
+            sha256_hash.update(byte_block)
+    if f'"{sha256_hash.hexdigest()}"' != etag:
+        return False
+    __save_etag(file_path, etag)
+    return True
+
+
+def __save_etag(file_path: str, etag: str) -> None:
+    with contextlib.suppress(OSError), builtins.open(f"{file_path}.etag", "w", encoding="utf-8") as etag_file:
+        etag_file.write(etag)
+
+
 def __fetch_model_as_snapshot(
     current_progress: int, progress_for_task, nc: NextcloudApp, mode_name: str, download_options: dict
 ) -> str:
@@ -0,0 +1,8 @@
+from collections.abc import Iterable
+
+
+def assert_shape(obj, schema: Iterable[tuple[str, type | tuple[type, ...]]]) -> None:
+    """Checks that every ``(name, type)`` pair of the ``schema`` is an attribute or a key of ``obj`` of that type."""
+    get_value = obj.__getitem__ if isinstance(obj, dict) else obj.__getattribute__
+    for name, typ in schema:
+        assert isinstance(get_value(name), typ), name
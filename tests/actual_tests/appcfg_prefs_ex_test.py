@@ -7,21 +7,25 @@ from ..conftest import NC_APP, NC_APP_ASYNC
 if NC_APP is None:
     pytest.skip("Need App mode", allow_module_level=True)
 
+CLASSES_TO_TEST = (NC_APP.appconfig_ex, NC_APP.preferences_ex)
+ASYNC_CLASSES_TO_TEST = (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex)
+CLASSES_IDS = ("appconfig_ex", "preferences_ex")
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_get_value_invalid(class_to_test):
     with pytest.raises(ValueError):
         class_to_test.get_value("")
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_get_value_invalid_async(class_to_test):
     with pytest.raises(ValueError):
         await class_to_test.get_value("")
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_get_values_invalid(class_to_test):
     assert class_to_test.get_values([]) == []
     with pytest.raises(ValueError):
@@ -31,7 +35,7 @@ def test_cfg_ex_get_values_invalid(class_to_test):
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_get_values_invalid_async(class_to_test):
     assert await class_to_test.get_values([]) == []
     with pytest.raises(ValueError):
@@ -40,20 +44,20 @@ async def test_cfg_ex_get_values_invalid_async(class_to_test):
         await class_to_test.get_values(["", "k"])
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_set_empty_key(class_to_test):
     with pytest.raises(ValueError):
         class_to_test.set_value("", "some value")
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_set_empty_key_async(class_to_test):
     with pytest.raises(ValueError):
         await class_to_test.set_value("", "some value")
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_delete_invalid(class_to_test):
     class_to_test.delete([])
     with pytest.raises(ValueError):
@@ -63,7 +67,7 @@ def test_cfg_ex_delete_invalid(class_to_test):
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_delete_invalid_async(class_to_test):
     await class_to_test.delete([])
     with pytest.raises(ValueError):
@@ -72,19 +76,19 @@ async def test_cfg_ex_delete_invalid_async(class_to_test):
         await class_to_test.delete(["", "k"])
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_get_default(class_to_test):
     assert class_to_test.get_value("non_existing_key", default="alice") == "alice"
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_get_default_async(class_to_test):
     assert await class_to_test.get_value("non_existing_key", default="alice") == "alice"
 
 
 @pytest.mark.parametrize("value", ("0", "1", "12 3", ""))
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_set_delete(value, class_to_test):
     class_to_test.delete("test_key")
     assert class_to_test.get_value("test_key") is None
@@ -98,7 +102,7 @@ def test_cfg_ex_set_delete(value, class_to_test):
 
 @pytest.mark.asyncio(scope="session")
 @pytest.mark.parametrize("value", ("0", "1", "12 3", ""))
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_set_delete_async(value, class_to_test):
     await class_to_test.delete("test_key")
     assert await class_to_test.get_value("test_key") is None
@@ -110,7 +114,7 @@ async def test_cfg_ex_set_delete_async(value, class_to_test):
     assert await class_to_test.get_value("test_key") is None
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_delete(class_to_test):
     class_to_test.set_value("test_key", "123")
     assert class_to_test.get_value("test_key")
@@ -125,7 +129,7 @@ def test_cfg_ex_delete(class_to_test):
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_delete_async(class_to_test):
     await class_to_test.set_value("test_key", "123")
     assert await class_to_test.get_value("test_key")
@@ -139,7 +143,7 @@ async def test_cfg_ex_delete_async(class_to_test):
         await class_to_test.delete(["test_key"], not_fail=False)
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_get(class_to_test):
     class_to_test.delete(["test key", "test key2"])
     assert len(class_to_test.get_values(["test key", "test key2"])) == 0
@@ -150,7 +154,7 @@ def test_cfg_ex_get(class_to_test):
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_get_async(class_to_test):
     await class_to_test.delete(["test key", "test key2"])
     assert len(await class_to_test.get_values(["test key", "test key2"])) == 0
@@ -160,7 +164,7 @@ async def test_cfg_ex_get_async(class_to_test):
     assert len(await class_to_test.get_values(["test key", "test key2"])) == 2
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_multiply_delete(class_to_test):
     class_to_test.set_value("test_key", "123")
     class_to_test.set_value("test_key2", "123")
@@ -175,7 +179,7 @@ def test_cfg_ex_multiply_delete(class_to_test):
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_multiply_delete_async(class_to_test):
     await class_to_test.set_value("test_key", "123")
     await class_to_test.set_value("test_key2", "123")
@@ -190,7 +194,7 @@ async def test_cfg_ex_multiply_delete_async(class_to_test):
 
 
 @pytest.mark.parametrize("key", ("k", "k y", " "))
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_get_non_existing(key, class_to_test):
     class_to_test.delete(key)
     assert class_to_test.get_value(key) is None
@@ -200,7 +204,7 @@ def test_cfg_ex_get_non_existing(key, class_to_test):
 
 @pytest.mark.asyncio(scope="session")
 @pytest.mark.parametrize("key", ("k", "k y", " "))
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_get_non_existing_async(key, class_to_test):
     await class_to_test.delete(key)
     assert await class_to_test.get_value(key) is None
@@ -208,7 +212,7 @@ async def test_cfg_ex_get_non_existing_async(key, class_to_test):
     assert len(await class_to_test.get_values([key, "non_existing_key"])) == 0
 
 
-@pytest.mark.parametrize("class_to_test", (NC_APP.appconfig_ex, NC_APP.preferences_ex))
+@pytest.mark.parametrize("class_to_test", CLASSES_TO_TEST, ids=CLASSES_IDS)
 def test_cfg_ex_get_typing(class_to_test):
     class_to_test.set_value("test key", "123")
     class_to_test.set_value("test key2", "321")
@@ -221,7 +225,7 @@ def test_cfg_ex_get_typing(class_to_test):
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("class_to_test", (NC_APP_ASYNC.appconfig_ex, NC_APP_ASYNC.preferences_ex))
+@pytest.mark.parametrize("class_to_test", ASYNC_CLASSES_TO_TEST, ids=CLASSES_IDS)
 async def test_cfg_ex_get_typing_async(class_to_test):
     await class_to_test.set_value("test key", "123")
     await class_to_test.set_value("test key2", "321")
@@ -6,7 +6,14 @@ from random import randbytes
 import pytest
 from PIL import Image
 
-from nc_py_api import Nextcloud, NextcloudApp, NextcloudException, _session  # noqa
+from nc_py_api import (  # noqa
+    Nextcloud,
+    NextcloudApp,
+    NextcloudException,
+    _session,
+    talk,
+    talk_bot,
+)
 
 from ..conftest import NC_CLIENT
 
@@ -19,6 +26,20 @@ def rand_bytes() -> bytes:
     return randbytes(64)
 
 
+@pytest.fixture(scope="session")
+def avatar_png() -> bytes:
+    """Returns PNG image for the avatar tests, rendered only once."""
+    buffer = BytesIO()
+    Image.effect_mandelbrot((512, 512), (-3, -2.5, 2, 2.5), 100).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def unique_name(name: str) -> str:
+    """Appends the ``pytest-xdist`` worker ID to the ``name``, so workers never touch each other's server objects."""
+    worker = environ.get("PYTEST_XDIST_WORKER")
+    return f"{name}_{worker}" if worker else name
+
+
 def init_filesystem_for_user(nc_any, rand_bytes):
     """
     /test_empty_dir
@@ -44,6 +65,7 @@ def init_filesystem_for_user(nc_any, rand_bytes):
     clean_filesystem_for_user(nc_any)
     im = BytesIO()
     Image.linear_gradient("L").resize((768, 768)).save(im, format="PNG")
+    generated_image = im.getvalue()
     nc_any.files.mkdir("/test_empty_dir")
     nc_any.files.makedirs("/test_empty_dir_in_dir/test_empty_child_dir")
     nc_any.files.makedirs("/test_dir/subdir")
@@ -55,8 +77,7 @@ def init_filesystem_for_user(nc_any, rand_bytes):
         nc_any.files.upload(path.join(folder, "test_empty_text.txt"), content=b"")
         nc_any.files.upload(path.join(folder, "test_64_bytes.bin"), content=rand_bytes)
         nc_any.files.upload(path.join(folder, "test_12345_text.txt"), content="12345")
-        im.seek(0)
-        nc_any.files.upload(path.join(folder, "test_generated_image.png"), content=im.read())
+        nc_any.files.upload(path.join(folder, "test_generated_image.png"), content=generated_image)
         nc_any.files.setfav(path.join(folder, "test_generated_image.png"), True)
 
     init_folder()
@@ -80,43 +101,112 @@ def clean_filesystem_for_user(nc_any):
         nc_any.files.delete(i, not_fail=True)
 
 
-@pytest.fixture(autouse=True, scope="session")
-def tear_up_down(nc_any, rand_bytes):
-    if NC_CLIENT:
-        # create two additional groups
-        environ["TEST_GROUP_BOTH"] = "test_nc_py_api_group_both"
-        environ["TEST_GROUP_USER"] = "test_nc_py_api_group_user"
-        with contextlib.suppress(NextcloudException):
-            NC_CLIENT.users_groups.delete(environ["TEST_GROUP_BOTH"])
-        with contextlib.suppress(NextcloudException):
-            NC_CLIENT.users_groups.delete(environ["TEST_GROUP_USER"])
-        NC_CLIENT.users_groups.create(group_id=environ["TEST_GROUP_BOTH"])
-        NC_CLIENT.users_groups.create(group_id=environ["TEST_GROUP_USER"])
-        # create two additional users
-        environ["TEST_ADMIN_ID"] = "test_nc_py_api_admin"
-        environ["TEST_ADMIN_PASS"] = "az1dcaNG4c42"
-        environ["TEST_USER_ID"] = "test_nc_py_api_user"
-        environ["TEST_USER_PASS"] = "DC89GvaR42lk"
-        with contextlib.suppress(NextcloudException):
-            NC_CLIENT.users.delete(environ["TEST_ADMIN_ID"])
-        with contextlib.suppress(NextcloudException):
-            NC_CLIENT.users.delete(environ["TEST_USER_ID"])
-        NC_CLIENT.users.create(
-            environ["TEST_ADMIN_ID"], password=environ["TEST_ADMIN_PASS"], groups=["admin", environ["TEST_GROUP_BOTH"]]
-        )
-        NC_CLIENT.users.create(
-            environ["TEST_USER_ID"],
-            password=environ["TEST_USER_PASS"],
-            groups=[environ["TEST_GROUP_BOTH"], environ["TEST_GROUP_USER"]],
-            display_name=environ["TEST_USER_ID"],
-        )
-    init_filesystem_for_user(nc_any, rand_bytes)  # currently we initialize filesystem only for admin
+def _create_test_users_and_groups():
+    with contextlib.suppress(NextcloudException):
+        NC_CLIENT.users_groups.delete(environ["TEST_GROUP_BOTH"])
+    with contextlib.suppress(NextcloudException):
+        NC_CLIENT.users_groups.delete(environ["TEST_GROUP_USER"])
+    NC_CLIENT.users_groups.create(group_id=environ["TEST_GROUP_BOTH"])
+    NC_CLIENT.users_groups.create(group_id=environ["TEST_GROUP_USER"])
+    with contextlib.suppress(NextcloudException):
+        NC_CLIENT.users.delete(environ["TEST_ADMIN_ID"])
+    with contextlib.suppress(NextcloudException):
+        NC_CLIENT.users.delete(environ["TEST_USER_ID"])
+    NC_CLIENT.users.create(
+        environ["TEST_ADMIN_ID"], password=environ["TEST_ADMIN_PASS"], groups=["admin", environ["TEST_GROUP_BOTH"]]
+    )
+    NC_CLIENT.users.create(
+        environ["TEST_USER_ID"],
+        password=environ["TEST_USER_PASS"],
+        groups=[environ["TEST_GROUP_BOTH"], environ["TEST_GROUP_USER"]],
+        display_name=environ["TEST_USER_ID"],
+    )
+
+
+def _delete_test_users_and_groups():
+    NC_CLIENT.users.delete(environ["TEST_ADMIN_ID"])
+    NC_CLIENT.users.delete(environ["TEST_USER_ID"])
+    NC_CLIENT.users_groups.delete(environ["TEST_GROUP_BOTH"])
+    NC_CLIENT.users_groups.delete(environ["TEST_GROUP_USER"])
+
+
+@contextlib.contextmanager
+def _xdist_workers_counter(tmp_path_factory, delta: int):
+    """Yields the number of ``pytest-xdist`` workers that were using the shared server state before this one.
+
+    All workers of one run share the parent of their base temporary directory, so a file lock there serializes
+    the setup and the teardown of the server state between them.
+    """
+    import fcntl  # POSIX only, and needed only under `pytest-xdist`, so the suite still imports on Windows
+
+    shared_dir = tmp_path_factory.getbasetemp().parent
+    counter = shared_dir.joinpath("nc_py_api_workers")
+    with open(shared_dir.joinpath("nc_py_api_workers.lock"), "w", encoding="utf-8") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        workers = int(counter.read_text(encoding="utf-8")) if counter.exists() else 0
+        yield workers
+        counter.write_text(str(workers + delta), encoding="utf-8")
+
 
+@pytest.fixture(autouse=True, scope="session")
+def tear_up_down(nc_any, rand_bytes, tmp_path_factory):
+    environ["TEST_GROUP_BOTH"] = "test_nc_py_api_group_both"
+    environ["TEST_GROUP_USER"] = "test_nc_py_api_group_user"
+    environ["TEST_ADMIN_ID"] = "test_nc_py_api_admin"
+    environ["TEST_ADMIN_PASS"] = "az1dcaNG4c42"
+    environ["TEST_USER_ID"] = "test_nc_py_api_user"
+    environ["TEST_USER_PASS"] = "DC89GvaR42lk"
+
+    def set_up():
+        if NC_CLIENT:
+            _create_test_users_and_groups()
+        init_filesystem_for_user(nc_any, rand_bytes)  # currently we initialize filesystem only for admin
+
+    def tear_down():
+        clean_filesystem_for_user(nc_any)
+        if NC_CLIENT:
+            _delete_test_users_and_groups()
+
+    if "PYTEST_XDIST_WORKER" not in environ:
+        set_up()
+        yield
+        tear_down()
+        return
+
+    # with `pytest-xdist` the first worker to start prepares the server and the last one to finish cleans it up
+    with _xdist_workers_counter(tmp_path_factory, 1) as workers:
+        if not workers:
+            set_up()
     yield
+    with _xdist_workers_counter(tmp_path_factory, -1) as workers:
+        if workers == 1:
+            tear_down()
 
-    clean_filesystem_for_user(nc_any)
-    if NC_CLIENT:
-        NC_CLIENT.users.delete(environ["TEST_ADMIN_ID"])
-        NC_CLIENT.users.delete(environ["TEST_USER_ID"])
-        NC_CLIENT.users_groups.delete(environ["TEST_GROUP_BOTH"])
-        NC_CLIENT.users_groups.delete(environ["TEST_GROUP_USER"])
+
+@pytest.fixture(scope="module")
+def group_conversation(nc_any) -> talk.Conversation:
+    """Group conversation shared between the tests of one module, created and deleted only once."""
+    if nc_any.talk.available is False:
+        pytest.skip("Nextcloud Talk is not installed")
+    conversation = nc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
+    yield conversation
+    nc_any.talk.delete_conversation(conversation.token)
+
+
+@pytest.fixture(scope="session")
+def nc_second_user(nc_client) -> Nextcloud:
+    """Client logged in as ``TEST_USER_ID`` with the ``away`` status, shared by the whole session."""
+    nc_user = Nextcloud(nc_auth_user=environ["TEST_USER_ID"], nc_auth_pass=environ["TEST_USER_PASS"])
+    nc_user.user_status.set_status_type("away")
+    return nc_user
+
+
+@pytest.fixture(scope="session")
+def talk_bot_coverage(nc_app) -> talk_bot.TalkBot:
+    """``/talk_bot_coverage`` bot, registered once for the whole session."""
+    if nc_app.talk.bots_available is False:
+        pytest.skip("Need Talk bots support")
+    bot = talk_bot.TalkBot("/talk_bot_coverage", "Coverage bot", "Desc")
+    bot.enabled_handler(True, nc_app)
+    yield bot
+    bot.enabled_handler(False, nc_app)
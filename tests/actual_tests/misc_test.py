@@ -1,6 +1,7 @@
 import datetime
 import io
 import os
+from unittest import mock
 
 import pytest
 from httpx import Request, Response
@@ -147,6 +148,32 @@ async def test_no_initial_connection_async(anc_any):
     assert new_nc._session._capabilities
 
 
+def test_available_from_cached_capabilities(nc_any):
+    new_nc = Nextcloud() if isinstance(nc_any, Nextcloud) else NextcloudApp()
+    _ = new_nc.capabilities
+    with mock.patch.object(new_nc._session, "update_server_info", side_effect=AssertionError("capabilities refetch")):
+        for _ in range(2):
+            assert isinstance(new_nc.talk.available, bool)
+            assert isinstance(new_nc.preferences.available, bool)
+            assert isinstance(new_nc.weather_status.available, bool)
+    new_nc.update_server_info()  # explicit invalidation still goes to the server
+    assert new_nc._session._capabilities
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_available_from_cached_capabilities_async(anc_any):
+    new_nc = AsyncNextcloud() if isinstance(anc_any, AsyncNextcloud) else AsyncNextcloudApp()
+    _ = await new_nc.capabilities
+    with mock.patch.object(new_nc._session, "update_server_info", side_effect=AssertionError("capabilities refetch")):
+        for _ in range(2):
+            assert isinstance(await new_nc.talk.available, bool)
+            assert isinstance(await new_nc.preferences.available, bool)
+            assert isinstance(await new_nc.weather_status.available, bool)
+    await new_nc.update_server_info()  # explicit invalidation still goes to the server
+    assert new_nc._session._capabilities
+
+
+@pytest.mark.xdist_group("weather_location")
 def test_ocs_timeout(nc_any):
     new_nc = Nextcloud(npa_timeout=0.01) if isinstance(nc_any, Nextcloud) else NextcloudApp(npa_timeout=0.01)
     with pytest.raises(NextcloudException) as e:
@@ -157,6 +184,7 @@ def test_ocs_timeout(nc_any):
     assert e.value.status_code == 408
 
 
+@pytest.mark.xdist_group("weather_location")
 @pytest.mark.asyncio(scope="session")
 async def test_ocs_timeout_async(anc_any):
     new_nc = (
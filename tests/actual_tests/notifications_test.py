@@ -25,6 +25,13 @@ async def test_create_as_client_async(anc_client):
         await anc_client.notifications.create("caption")
 
 
+@pytest.fixture
+def clean_notifications(nc_app):
+    """Removes, with one request, everything the test created; the async app shares the same user and notifications."""
+    yield
+    nc_app.notifications.delete_all()
+
+
 def _test_create(new_notification: Notification):
     assert isinstance(new_notification, Notification)
     assert new_notification.subject == "subject0123"
@@ -36,20 +43,20 @@ def _test_create(new_notification: Notification):
     assert isinstance(new_notification.object_type, str)
 
 
-def test_create(nc_app):
+def test_create(nc_app, clean_notifications):
     obj_id = nc_app.notifications.create("subject0123", "message456")
     new_notification = nc_app.notifications.by_object_id(obj_id)
     _test_create(new_notification)
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_create_async(anc_app):
+async def test_create_async(anc_app, clean_notifications):
     obj_id = await anc_app.notifications.create("subject0123", "message456")
     new_notification = await anc_app.notifications.by_object_id(obj_id)
     _test_create(new_notification)
 
 
-def test_create_link_icon(nc_app):
+def test_create_link_icon(nc_app, clean_notifications):
     obj_id = nc_app.notifications.create("1", "", link="https://some.link/gg")
     new_notification = nc_app.notifications.by_object_id(obj_id)
     assert isinstance(new_notification, Notification)
@@ -60,7 +67,7 @@ def test_create_link_icon(nc_app):
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_create_link_icon_async(anc_app):
+async def test_create_link_icon_async(anc_app, clean_notifications):
     obj_id = await anc_app.notifications.create("1", "", link="https://some.link/gg")
     new_notification = await anc_app.notifications.by_object_id(obj_id)
     assert isinstance(new_notification, Notification)
@@ -70,33 +77,29 @@ async def test_create_link_icon_async(anc_app):
     assert new_notification.link == "https://some.link/gg"
 
 
+@pytest.mark.slow
 def test_delete_all(nc_app):
     nc_app.notifications.create("subject0123", "message456")
     obj_id1 = nc_app.notifications.create("subject0123", "message456")
-    ntf1 = nc_app.notifications.by_object_id(obj_id1)
-    assert ntf1
     obj_id2 = nc_app.notifications.create("subject0123", "message456")
-    ntf2 = nc_app.notifications.by_object_id(obj_id2)
-    assert ntf2
+    notifications = {i.object_id: i for i in nc_app.notifications.get_all()}
+    ntf1 = notifications[obj_id1]
+    ntf2 = notifications[obj_id2]
     nc_app.notifications.delete_all()
-    assert nc_app.notifications.by_object_id(obj_id1) is None
-    assert nc_app.notifications.by_object_id(obj_id2) is None
     assert not nc_app.notifications.get_all()
     assert not nc_app.notifications.exists([ntf1.notification_id, ntf2.notification_id])
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio(scope="session")
 async def test_delete_all_async(anc_app):
     await anc_app.notifications.create("subject0123", "message456")
     obj_id1 = await anc_app.notifications.create("subject0123", "message456")
-    ntf1 = await anc_app.notifications.by_object_id(obj_id1)
-    assert ntf1
     obj_id2 = await anc_app.notifications.create("subject0123", "message456")
-    ntf2 = await anc_app.notifications.by_object_id(obj_id2)
-    assert ntf2
+    notifications = {i.object_id: i for i in await anc_app.notifications.get_all()}
+    ntf1 = notifications[obj_id1]
+    ntf2 = notifications[obj_id2]
     await anc_app.notifications.delete_all()
-    assert await anc_app.notifications.by_object_id(obj_id1) is None
-    assert await anc_app.notifications.by_object_id(obj_id2) is None
     assert not await anc_app.notifications.get_all()
     assert not await anc_app.notifications.exists([ntf1.notification_id, ntf2.notification_id])
 
@@ -137,8 +140,7 @@ async def test_create_invalid_args_async(anc_app):
         await anc_app.notifications.create("")
 
 
-def test_get_one(nc_app):
-    nc_app.notifications.delete_all()
+def test_get_one(nc_app, clean_notifications):
     obj_id1 = nc_app.notifications.create("subject0123")
     obj_id2 = nc_app.notifications.create("subject0123")
     ntf1 = nc_app.notifications.by_object_id(obj_id1)
@@ -150,8 +152,7 @@ def test_get_one(nc_app):
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_get_one_async(anc_app):
-    await anc_app.notifications.delete_all()
+async def test_get_one_async(anc_app, clean_notifications):
     obj_id1 = await anc_app.notifications.create("subject0123")
     obj_id2 = await anc_app.notifications.create("subject0123")
     ntf1 = await anc_app.notifications.by_object_id(obj_id1)
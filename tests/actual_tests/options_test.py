@@ -1,49 +1,60 @@
+import contextlib
+import importlib
+import multiprocessing
 import os
-import sys
-from subprocess import PIPE, run
+import tempfile
 from unittest import mock
 
 import nc_py_api
 
 
+def _write_env(env_file: str, content: str) -> None:
+    """Atomically replaces the ``.env`` file, skipping the write when the content is already the same."""
+    with contextlib.suppress(FileNotFoundError), open(env_file, "rb") as env_f:
+        if env_f.read() == content.encode():
+            return
+    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(env_file), delete=False) as tmp_f:
+        tmp_f.write(content)
+    os.replace(tmp_f.name, env_file)
+
+
+def _check_options(project_dir: str, cases: list[tuple[dict[str, str], str, object]]) -> None:
+    """Reloads ``nc_py_api.options`` once per case, with case's ``env`` applied on top of the inherited environment."""
+    os.chdir(project_dir)  # `load_dotenv` looks for `.env` in the current directory
+    for env, name, expected in cases:
+        with mock.patch.dict(os.environ, env):
+            if name not in env:  # value should come from the `.env` file
+                os.environ.pop(name, None)
+            importlib.reload(nc_py_api.options)
+        value = getattr(nc_py_api.options, name)
+        assert value == expected and type(value) is type(expected), f"{env or '.env'}: {name}={value!r}"
+
+
 def test_timeouts():
     project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     env_file = os.path.join(project_dir, ".env")
     env_backup_file = os.path.join(project_dir, ".env.backup")
     if os.path.exists(env_file):
         os.rename(env_file, env_backup_file)
+    # all cases are checked in one child forked from a server that has `nc_py_api` already imported
+    mp_ctx = multiprocessing.get_context("forkserver")
+    mp_ctx.set_forkserver_preload(["nc_py_api"])
     try:
-        check_command = [sys.executable, "-c", "import nc_py_api\nassert nc_py_api.options.NPA_TIMEOUT is None"]
-        with open(env_file, "w") as env_f:
-            env_f.write("NPA_TIMEOUT=None")
-        r = run(check_command, stderr=PIPE, env={}, cwd=project_dir, check=False)
-        assert not r.stderr
-        check_command = [sys.executable, "-c", "import nc_py_api\nassert nc_py_api.options.NPA_TIMEOUT == 11"]
-        with open(env_file, "w") as env_f:
-            env_f.write("NPA_TIMEOUT=11")
-        r = run(check_command, stderr=PIPE, env={}, cwd=project_dir, check=False)
-        assert not r.stderr
-        check_command = [sys.executable, "-c", "import nc_py_api\nassert nc_py_api.options.NPA_TIMEOUT_DAV is None"]
-        with open(env_file, "w") as env_f:
-            env_f.write("NPA_TIMEOUT_DAV=None")
-        r = run(check_command, stderr=PIPE, env={}, cwd=project_dir, check=False)
-        assert not r.stderr
-        check_command = [sys.executable, "-c", "import nc_py_api\nassert nc_py_api.options.NPA_TIMEOUT_DAV == 11"]
-        with open(env_file, "w") as env_f:
-            env_f.write("NPA_TIMEOUT_DAV=11")
-        r = run(check_command, stderr=PIPE, env={}, cwd=project_dir, check=False)
-        assert not r.stderr
-        check_command = [sys.executable, "-c", "import nc_py_api\nassert nc_py_api.options.NPA_NC_CERT is False"]
-        with open(env_file, "w") as env_f:
-            env_f.write("NPA_NC_CERT=False")
-        r = run(check_command, stderr=PIPE, env={}, cwd=project_dir, check=False)
-        assert not r.stderr
-        check_command = [sys.executable, "-c", "import nc_py_api\nassert nc_py_api.options.NPA_NC_CERT == ''"]
-        with open(env_file, "w") as env_f:
-            env_f.write('NPA_NC_CERT=""')
-        r = run(check_command, stderr=PIPE, env={}, cwd=project_dir, check=False)
-        assert not r.stderr
+        _write_env(env_file, "NPA_TIMEOUT=None")  # variables from the environment take precedence over `.env`
+        cases = [
+            ({"NPA_TIMEOUT": "None"}, "NPA_TIMEOUT", None),
+            ({"NPA_TIMEOUT": "11"}, "NPA_TIMEOUT", 11),
+            ({"NPA_TIMEOUT_DAV": "None"}, "NPA_TIMEOUT_DAV", None),
+            ({"NPA_TIMEOUT_DAV": "11"}, "NPA_TIMEOUT_DAV", 11),
+            ({"NPA_NC_CERT": "False"}, "NPA_NC_CERT", False),
+            ({"NPA_NC_CERT": ""}, "NPA_NC_CERT", ""),
+            ({}, "NPA_TIMEOUT", None),
+        ]
+        with mp_ctx.Pool(1) as pool:
+            pool.apply(_check_options, (project_dir, cases))
     finally:
+        if os.path.exists(env_file):
+            os.remove(env_file)
         if os.path.exists(env_backup_file):
             os.rename(env_backup_file, env_file)
 
@@ -1,91 +1,111 @@
-from io import BytesIO
 from os import environ
 
 import pytest
-from PIL import Image
 
-from nc_py_api import AsyncNextcloud, Nextcloud, NextcloudException, files, talk
+from nc_py_api import AsyncNextcloud, NextcloudException, files, talk
+
+from ._schema import assert_shape
+
+pytestmark = pytest.mark.xdist_group("talk")  # tests here share conversations, statuses and `modified_since`
+
+CONV_SCHEMA = [
+    ("conversation_id", int),
+    ("token", str),
+    ("name", str),
+    ("conversation_type", talk.ConversationType),
+    ("display_name", str),
+    ("description", str),
+    ("participant_type", talk.ParticipantType),
+    ("attendee_id", int),
+    ("attendee_pin", str),
+    ("actor_type", str),
+    ("actor_id", str),
+    ("permissions", talk.AttendeePermissions),
+    ("attendee_permissions", talk.AttendeePermissions),
+    ("call_permissions", talk.AttendeePermissions),
+    ("default_permissions", talk.AttendeePermissions),
+    ("participant_flags", talk.InCallFlags),
+    ("read_only", bool),
+    ("listable", talk.ListableScope),
+    ("message_expiration", int),
+    ("has_password", bool),
+    ("has_call", bool),
+    ("call_flag", talk.InCallFlags),
+    ("can_start_call", bool),
+    ("can_delete_conversation", bool),
+    ("can_leave_conversation", bool),
+    ("last_activity", int),
+    ("is_favorite", bool),
+    ("notification_level", talk.NotificationLevel),
+    ("lobby_state", talk.WebinarLobbyStates),
+    ("lobby_timer", int),
+    ("sip_enabled", talk.SipEnabledStatus),
+    ("can_enable_sip", bool),
+    ("unread_messages_count", int),
+    ("unread_mention", bool),
+    ("unread_mention_direct", bool),
+    ("last_read_message", int),
+    ("last_message", (talk.TalkMessage, type(None))),
+    ("last_common_read_message", int),
+    ("breakout_room_mode", talk.BreakoutRoomMode),
+    ("breakout_room_status", talk.BreakoutRoomStatus),
+    ("avatar_version", str),
+    ("is_custom_avatar", bool),
+    ("call_start_time", int),
+    ("recording_status", talk.CallRecordingStatus),
+    ("status_type", str),
+    ("status_message", str),
+    ("status_icon", str),
+    ("status_clear_at", (int, type(None))),
+]
+
+MSG_SCHEMA = [
+    ("message_id", int),
+    ("token", str),
+    ("actor_id", str),
+    ("actor_display_name", str),
+    ("timestamp", int),
+    ("system_message", str),
+    ("reference_id", str),
+    ("message", str),
+    ("message_parameters", dict),
+    ("expiration_timestamp", int),
+    ("parent", list),
+    ("reactions", dict),
+    ("reactions_self", list),
+    ("markdown", bool),
+]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _require_talk(nc_any):
+    if nc_any.talk.available is False:
+        pytest.skip("Nextcloud Talk is not installed")
 
 
 def test_conversation_create_delete(nc):
-    if nc.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
     conversation = nc.talk.create_conversation(talk.ConversationType.GROUP, "admin")
+    assert nc.talk.get_conversation_by_token(conversation).token == conversation.token
     nc.talk.delete_conversation(conversation)
-    assert isinstance(conversation.conversation_id, int)
-    assert isinstance(conversation.token, str) and conversation.token
-    assert isinstance(conversation.name, str)
-    assert isinstance(conversation.conversation_type, talk.ConversationType)
-    assert isinstance(conversation.display_name, str)
-    assert isinstance(conversation.description, str)
-    assert isinstance(conversation.participant_type, talk.ParticipantType)
-    assert isinstance(conversation.attendee_id, int)
-    assert isinstance(conversation.attendee_pin, str)
-    assert isinstance(conversation.actor_type, str)
-    assert isinstance(conversation.actor_id, str)
-    assert isinstance(conversation.permissions, talk.AttendeePermissions)
-    assert isinstance(conversation.attendee_permissions, talk.AttendeePermissions)
-    assert isinstance(conversation.call_permissions, talk.AttendeePermissions)
-    assert isinstance(conversation.default_permissions, talk.AttendeePermissions)
-    assert isinstance(conversation.participant_flags, talk.InCallFlags)
-    assert isinstance(conversation.read_only, bool)
-    assert isinstance(conversation.listable, talk.ListableScope)
-    assert isinstance(conversation.message_expiration, int)
-    assert isinstance(conversation.has_password, bool)
-    assert isinstance(conversation.has_call, bool)
-    assert isinstance(conversation.call_flag, talk.InCallFlags)
-    assert isinstance(conversation.can_start_call, bool)
-    assert isinstance(conversation.can_delete_conversation, bool)
-    assert isinstance(conversation.can_leave_conversation, bool)
-    assert isinstance(conversation.last_activity, int)
-    assert isinstance(conversation.is_favorite, bool)
-    assert isinstance(conversation.notification_level, talk.NotificationLevel)
-    assert isinstance(conversation.lobby_state, talk.WebinarLobbyStates)
-    assert isinstance(conversation.lobby_timer, int)
-    assert isinstance(conversation.sip_enabled, talk.SipEnabledStatus)
-    assert isinstance(conversation.can_enable_sip, bool)
-    assert isinstance(conversation.unread_messages_count, int)
-    assert isinstance(conversation.unread_mention, bool)
-    assert isinstance(conversation.unread_mention_direct, bool)
-    assert isinstance(conversation.last_read_message, int)
-    assert isinstance(conversation.last_message, talk.TalkMessage) or conversation.last_message is None
-    assert isinstance(conversation.last_common_read_message, int)
-    assert isinstance(conversation.breakout_room_mode, talk.BreakoutRoomMode)
-    assert isinstance(conversation.breakout_room_status, talk.BreakoutRoomStatus)
-    assert isinstance(conversation.avatar_version, str)
-    assert isinstance(conversation.is_custom_avatar, bool)
-    assert isinstance(conversation.call_start_time, int)
-    assert isinstance(conversation.recording_status, talk.CallRecordingStatus)
-    assert isinstance(conversation.status_type, str)
-    assert isinstance(conversation.status_message, str)
-    assert isinstance(conversation.status_icon, str)
-    assert isinstance(conversation.status_clear_at, int) or conversation.status_clear_at is None
+    with pytest.raises(NextcloudException):
+        nc.talk.get_conversation_by_token(conversation)
+
+
+def test_conversation_shape(group_conversation):
+    conversation = group_conversation
+    assert_shape(conversation, CONV_SCHEMA)
+    assert conversation.token
     if conversation.last_message is None:
         return
     talk_msg = conversation.last_message
-    assert isinstance(talk_msg.message_id, int)
-    assert isinstance(talk_msg.token, str)
+    assert_shape(talk_msg, MSG_SCHEMA)
     assert talk_msg.actor_type in ("users", "guests", "bots", "bridged")
-    assert isinstance(talk_msg.actor_id, str)
-    assert isinstance(talk_msg.actor_display_name, str)
-    assert isinstance(talk_msg.timestamp, int)
-    assert isinstance(talk_msg.system_message, str)
     assert talk_msg.message_type in ("comment", "comment_deleted", "system", "command")
     assert talk_msg.is_replyable is False
-    assert isinstance(talk_msg.reference_id, str)
-    assert isinstance(talk_msg.message, str)
-    assert isinstance(talk_msg.message_parameters, dict)
-    assert isinstance(talk_msg.expiration_timestamp, int)
-    assert isinstance(talk_msg.parent, list)
-    assert isinstance(talk_msg.reactions, dict)
-    assert isinstance(talk_msg.reactions_self, list)
-    assert isinstance(talk_msg.markdown, bool)
-
-
-def test_get_conversations_modified_since(nc):
-    if nc.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-    conversation = nc.talk.create_conversation(talk.ConversationType.GROUP, "admin")
+
+
+def test_get_conversations_modified_since(nc, group_conversation):
+    modified_since = nc.talk.modified_since
     try:
         conversations = nc.talk.get_user_conversations()
         assert conversations
@@ -95,14 +115,12 @@ def test_get_conversations_modified_since(nc):
         conversations = nc.talk.get_user_conversations(modified_since=9992708529, no_status_update=False)
         assert not conversations
     finally:
-        nc.talk.delete_conversation(conversation.token)
+        nc.talk.modified_since = modified_since
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_get_conversations_modified_since_async(anc):
-    if await anc.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-    conversation = await anc.talk.create_conversation(talk.ConversationType.GROUP, "admin")
+async def test_get_conversations_modified_since_async(anc, group_conversation):
+    modified_since = anc.talk.modified_since
     try:
         conversations = await anc.talk.get_user_conversations()
         assert conversations
@@ -112,7 +130,7 @@ async def test_get_conversations_modified_since_async(anc):
         conversations = await anc.talk.get_user_conversations(modified_since=9992708529, no_status_update=False)
         assert not conversations
     finally:
-        await anc.talk.delete_conversation(conversation.token)
+        anc.talk.modified_since = modified_since
 
 
 def _test_get_conversations_include_status(participants: list[talk.Participant]):
@@ -132,21 +150,17 @@ def _test_get_conversations_include_status(participants: list[talk.Participant])
     assert str(second_participant).find("last_ping=") != -1
 
 
-def test_get_conversations_include_status(nc, nc_client):
-    if nc.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-    nc_second_user = Nextcloud(nc_auth_user=environ["TEST_USER_ID"], nc_auth_pass=environ["TEST_USER_PASS"])
-    nc_second_user.user_status.set_status_type("away")
+def test_get_conversations_include_status(nc, nc_second_user):
     nc_second_user.user_status.set_status("my status message", status_icon="😇")
     conversation = nc.talk.create_conversation(talk.ConversationType.ONE_TO_ONE, environ["TEST_USER_ID"])
     try:
         conversations = nc.talk.get_user_conversations(include_status=False)
         assert conversations
-        first_conv = next(i for i in conversations if i.conversation_id == conversation.conversation_id)
+        first_conv = {i.conversation_id: i for i in conversations}[conversation.conversation_id]
         assert not first_conv.status_type
         conversations = nc.talk.get_user_conversations(include_status=True)
         assert conversations
-        first_conv = next(i for i in conversations if i.conversation_id == conversation.conversation_id)
+        first_conv = {i.conversation_id: i for i in conversations}[conversation.conversation_id]
         assert first_conv.status_type == "away"
         assert first_conv.status_message == "my status message"
         assert first_conv.status_icon == "😇"
@@ -162,21 +176,17 @@ def test_get_conversations_include_status(nc, nc_client):
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_get_conversations_include_status_async(anc, anc_client):
-    if await anc.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-    nc_second_user = Nextcloud(nc_auth_user=environ["TEST_USER_ID"], nc_auth_pass=environ["TEST_USER_PASS"])
-    nc_second_user.user_status.set_status_type("away")
+async def test_get_conversations_include_status_async(anc, anc_client, nc_second_user):
     nc_second_user.user_status.set_status("my status message-async", status_icon="😇")
     conversation = await anc.talk.create_conversation(talk.ConversationType.ONE_TO_ONE, environ["TEST_USER_ID"])
     try:
         conversations = await anc.talk.get_user_conversations(include_status=False)
         assert conversations
-        first_conv = next(i for i in conversations if i.conversation_id == conversation.conversation_id)
+        first_conv = {i.conversation_id: i for i in conversations}[conversation.conversation_id]
         assert not first_conv.status_type
         conversations = await anc.talk.get_user_conversations(include_status=True)
         assert conversations
-        first_conv = next(i for i in conversations if i.conversation_id == conversation.conversation_id)
+        first_conv = {i.conversation_id: i for i in conversations}[conversation.conversation_id]
         assert first_conv.status_type == "away"
         assert first_conv.status_message == "my status message-async"
         assert first_conv.status_icon == "😇"
@@ -192,8 +202,6 @@ async def test_get_conversations_include_status_async(anc, anc_client):
 
 
 def test_rename_description_favorite_get_conversation(nc_any):
-    if nc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
     conversation = nc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
     try:
         nc_any.talk.rename_conversation(conversation, "new era")
@@ -225,8 +233,6 @@ def test_rename_description_favorite_get_conversation(nc_any):
 
 @pytest.mark.asyncio(scope="session")
 async def test_rename_description_favorite_get_conversation_async(anc_any):
-    if await anc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
     conversation = await anc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
     try:
         await anc_any.talk.rename_conversation(conversation, "new era")
@@ -256,65 +262,55 @@ async def test_rename_description_favorite_get_conversation_async(anc_any):
         await anc_any.talk.delete_conversation(conversation)
 
 
-def test_message_send_delete_reactions(nc_any):
-    if nc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-    conversation = nc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
-    try:
-        msg = nc_any.talk.send_message("yo yo yo!", conversation)
-        reactions = nc_any.talk.react_to_message(msg, "❤️")
-        assert "❤️" in reactions
-        assert len(reactions["❤️"]) == 1
-        reaction = reactions["❤️"][0]
-        assert reaction.actor_id == nc_any.user
-        assert reaction.actor_type == "users"
-        assert reaction.actor_display_name
-        assert isinstance(reaction.timestamp, int)
-        reactions2 = nc_any.talk.get_message_reactions(msg)
-        assert reactions == reactions2
-        nc_any.talk.react_to_message(msg, "☝️️")
-        assert nc_any.talk.delete_reaction(msg, "❤️")
-        assert not nc_any.talk.delete_reaction(msg, "☝️️")
-        assert not nc_any.talk.get_message_reactions(msg)
-        result = nc_any.talk.delete_message(msg)
-        assert result.system_message == "message_deleted"
-        messages = nc_any.talk.receive_messages(conversation)
-        deleted = [i for i in messages if i.system_message == "message_deleted"]
-        assert deleted
-        assert str(deleted[0]).find("time=") != -1
-    finally:
-        nc_any.talk.delete_conversation(conversation)
+def test_message_send_delete_reactions(nc_any, group_conversation):
+    conversation = group_conversation
+    msg = nc_any.talk.send_message("yo yo yo!", conversation)
+    reactions = nc_any.talk.react_to_message(msg, "❤️")
+    assert "❤️" in reactions
+    assert len(reactions["❤️"]) == 1
+    reaction = reactions["❤️"][0]
+    assert reaction.actor_id == nc_any.user
+    assert reaction.actor_type == "users"
+    assert reaction.actor_display_name
+    assert isinstance(reaction.timestamp, int)
+    reactions2 = nc_any.talk.get_message_reactions(msg)
+    assert reactions == reactions2
+    nc_any.talk.react_to_message(msg, "☝️️")
+    assert nc_any.talk.delete_reaction(msg, "❤️")
+    assert not nc_any.talk.delete_reaction(msg, "☝️️")
+    assert not nc_any.talk.get_message_reactions(msg)
+    result = nc_any.talk.delete_message(msg)
+    assert result.system_message == "message_deleted"
+    messages = nc_any.talk.receive_messages(conversation)
+    deleted = [i for i in messages if i.system_message == "message_deleted"]
+    assert deleted
+    assert str(deleted[0]).find("time=") != -1
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_message_send_delete_reactions_async(anc_any):
-    if await anc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-    conversation = await anc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
-    try:
-        msg = await anc_any.talk.send_message("yo yo yo!", conversation)
-        reactions = await anc_any.talk.react_to_message(msg, "❤️")
-        assert "❤️" in reactions
-        assert len(reactions["❤️"]) == 1
-        reaction = reactions["❤️"][0]
-        assert reaction.actor_id == await anc_any.user
-        assert reaction.actor_type == "users"
-        assert reaction.actor_display_name
-        assert isinstance(reaction.timestamp, int)
-        reactions2 = await anc_any.talk.get_message_reactions(msg)
-        assert reactions == reactions2
-        await anc_any.talk.react_to_message(msg, "☝️️")
-        assert await anc_any.talk.delete_reaction(msg, "❤️")
-        assert not await anc_any.talk.delete_reaction(msg, "☝️️")
-        assert not await anc_any.talk.get_message_reactions(msg)
-        result = await anc_any.talk.delete_message(msg)
-        assert result.system_message == "message_deleted"
-        messages = await anc_any.talk.receive_messages(conversation)
-        deleted = [i for i in messages if i.system_message == "message_deleted"]
-        assert deleted
-        assert str(deleted[0]).find("time=") != -1
-    finally:
-        await anc_any.talk.delete_conversation(conversation)
+async def test_message_send_delete_reactions_async(anc_any, group_conversation):
+    conversation = group_conversation
+    msg = await anc_any.talk.send_message("yo yo yo!", conversation)
+    reactions = await anc_any.talk.react_to_message(msg, "❤️")
+    assert "❤️" in reactions
+    assert len(reactions["❤️"]) == 1
+    reaction = reactions["❤️"][0]
+    assert reaction.actor_id == await anc_any.user
+    assert reaction.actor_type == "users"
+    assert reaction.actor_display_name
+    assert isinstance(reaction.timestamp, int)
+    reactions2 = await anc_any.talk.get_message_reactions(msg)
+    assert reactions == reactions2
+    await anc_any.talk.react_to_message(msg, "☝️️")
+    assert await anc_any.talk.delete_reaction(msg, "❤️")
+    assert not await anc_any.talk.delete_reaction(msg, "☝️️")
+    assert not await anc_any.talk.get_message_reactions(msg)
+    result = await anc_any.talk.delete_message(msg)
+    assert result.system_message == "message_deleted"
+    messages = await anc_any.talk.receive_messages(conversation)
+    deleted = [i for i in messages if i.system_message == "message_deleted"]
+    assert deleted
+    assert str(deleted[0]).find("time=") != -1
 
 
 def _test_create_close_poll(poll: talk.Poll, closed: bool, user: str, conversation_token: str):
@@ -334,130 +330,99 @@ def _test_create_close_poll(poll: talk.Poll, closed: bool, user: str, conversati
     assert poll.votes == []
 
 
-def test_create_close_poll(nc_any):
-    if nc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
-    conversation = nc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
-    try:
-        poll = nc_any.talk.create_poll(conversation, "When was this test written?", ["2000", "2023", "2030"])
-        assert str(poll).find("author=") != -1
-        _test_create_close_poll(poll, False, nc_any.user, conversation.token)
-        poll = nc_any.talk.get_poll(poll)
-        _test_create_close_poll(poll, False, nc_any.user, conversation.token)
-        poll = nc_any.talk.get_poll(poll.poll_id, conversation.token)
-        _test_create_close_poll(poll, False, nc_any.user, conversation.token)
-        poll = nc_any.talk.close_poll(poll.poll_id, conversation.token)
-        _test_create_close_poll(poll, True, nc_any.user, conversation.token)
-    finally:
-        nc_any.talk.delete_conversation(conversation)
+def test_create_close_poll(nc_any, group_conversation):
+    conversation = group_conversation
+    poll = nc_any.talk.create_poll(conversation, "When was this test written?", ["2000", "2023", "2030"])
+    assert str(poll).find("author=") != -1
+    _test_create_close_poll(poll, False, nc_any.user, conversation.token)
+    poll = nc_any.talk.get_poll(poll)
+    _test_create_close_poll(poll, False, nc_any.user, conversation.token)
+    poll = nc_any.talk.get_poll(poll.poll_id, conversation.token)
+    _test_create_close_poll(poll, False, nc_any.user, conversation.token)
+    poll = nc_any.talk.close_poll(poll.poll_id, conversation.token)
+    _test_create_close_poll(poll, True, nc_any.user, conversation.token)
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_create_close_poll_async(anc_any):
-    if await anc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
-    conversation = await anc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
-    try:
-        poll = await anc_any.talk.create_poll(conversation, "When was this test written?", ["2000", "2023", "2030"])
-        assert str(poll).find("author=") != -1
-        _test_create_close_poll(poll, False, await anc_any.user, conversation.token)
-        poll = await anc_any.talk.get_poll(poll)
-        _test_create_close_poll(poll, False, await anc_any.user, conversation.token)
-        poll = await anc_any.talk.get_poll(poll.poll_id, conversation.token)
-        _test_create_close_poll(poll, False, await anc_any.user, conversation.token)
-        poll = await anc_any.talk.close_poll(poll.poll_id, conversation.token)
-        _test_create_close_poll(poll, True, await anc_any.user, conversation.token)
-    finally:
-        await anc_any.talk.delete_conversation(conversation)
-
-
-def test_vote_poll(nc_any):
-    if nc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
-    conversation = nc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
-    try:
-        poll = nc_any.talk.create_poll(
-            conversation, "what color is the grass", ["red", "green", "blue"], hidden_results=False, max_votes=3
-        )
-        assert poll.hidden_results is False
-        assert not poll.voted_self
-        poll = nc_any.talk.vote_poll([0, 2], poll)
-        assert poll.voted_self == [0, 2]
-        assert poll.votes == {
-            "option-0": 1,
-            "option-2": 1,
-        }
-        assert poll.num_voters == 1
-        poll = nc_any.talk.vote_poll([1], poll.poll_id, conversation)
-        assert poll.voted_self == [1]
-        assert poll.votes == {
-            "option-1": 1,
-        }
-        poll = nc_any.talk.close_poll(poll)
-        assert poll.closed is True
-        assert len(poll.details) == 1
-        assert poll.details[0].actor_id == nc_any.user
-        assert poll.details[0].actor_type == "users"
-        assert poll.details[0].option == 1
-        assert isinstance(poll.details[0].actor_display_name, str)
-        assert str(poll.details[0]).find("actor=") != -1
-    finally:
-        nc_any.talk.delete_conversation(conversation)
+async def test_create_close_poll_async(anc_any, group_conversation):
+    conversation = group_conversation
+    poll = await anc_any.talk.create_poll(conversation, "When was this test written?", ["2000", "2023", "2030"])
+    assert str(poll).find("author=") != -1
+    _test_create_close_poll(poll, False, await anc_any.user, conversation.token)
+    poll = await anc_any.talk.get_poll(poll)
+    _test_create_close_poll(poll, False, await anc_any.user, conversation.token)
+    poll = await anc_any.talk.get_poll(poll.poll_id, conversation.token)
+    _test_create_close_poll(poll, False, await anc_any.user, conversation.token)
+    poll = await anc_any.talk.close_poll(poll.poll_id, conversation.token)
+    _test_create_close_poll(poll, True, await anc_any.user, conversation.token)
+
+
+def test_vote_poll(nc_any, group_conversation):
+    conversation = group_conversation
+    poll = nc_any.talk.create_poll(
+        conversation, "what color is the grass", ["red", "green", "blue"], hidden_results=False, max_votes=3
+    )
+    assert poll.hidden_results is False
+    assert not poll.voted_self
+    poll = nc_any.talk.vote_poll([0, 2], poll)
+    assert poll.voted_self == [0, 2]
+    assert poll.votes == {
+        "option-0": 1,
+        "option-2": 1,
+    }
+    assert poll.num_voters == 1
+    poll = nc_any.talk.vote_poll([1], poll.poll_id, conversation)
+    assert poll.voted_self == [1]
+    assert poll.votes == {
+        "option-1": 1,
+    }
+    poll = nc_any.talk.close_poll(poll)
+    assert poll.closed is True
+    assert len(poll.details) == 1
+    assert poll.details[0].actor_id == nc_any.user
+    assert poll.details[0].actor_type == "users"
+    assert poll.details[0].option == 1
+    assert isinstance(poll.details[0].actor_display_name, str)
+    assert str(poll.details[0]).find("actor=") != -1
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_vote_poll_async(anc_any):
-    if await anc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
-    conversation = await anc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
-    try:
-        poll = await anc_any.talk.create_poll(
-            conversation, "what color is the grass", ["red", "green", "blue"], hidden_results=False, max_votes=3
-        )
-        assert poll.hidden_results is False
-        assert not poll.voted_self
-        poll = await anc_any.talk.vote_poll([0, 2], poll)
-        assert poll.voted_self == [0, 2]
-        assert poll.votes == {
-            "option-0": 1,
-            "option-2": 1,
-        }
-        assert poll.num_voters == 1
-        poll = await anc_any.talk.vote_poll([1], poll.poll_id, conversation)
-        assert poll.voted_self == [1]
-        assert poll.votes == {
-            "option-1": 1,
-        }
-        poll = await anc_any.talk.close_poll(poll)
-        assert poll.closed is True
-        assert len(poll.details) == 1
-        assert poll.details[0].actor_id == await anc_any.user
-        assert poll.details[0].actor_type == "users"
-        assert poll.details[0].option == 1
-        assert isinstance(poll.details[0].actor_display_name, str)
-        assert str(poll.details[0]).find("actor=") != -1
-    finally:
-        await anc_any.talk.delete_conversation(conversation)
-
-
-def test_conversation_avatar(nc_any):
-    if nc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
+async def test_vote_poll_async(anc_any, group_conversation):
+    conversation = group_conversation
+    poll = await anc_any.talk.create_poll(
+        conversation, "what color is the grass", ["red", "green", "blue"], hidden_results=False, max_votes=3
+    )
+    assert poll.hidden_results is False
+    assert not poll.voted_self
+    poll = await anc_any.talk.vote_poll([0, 2], poll)
+    assert poll.voted_self == [0, 2]
+    assert poll.votes == {
+        "option-0": 1,
+        "option-2": 1,
+    }
+    assert poll.num_voters == 1
+    poll = await anc_any.talk.vote_poll([1], poll.poll_id, conversation)
+    assert poll.voted_self == [1]
+    assert poll.votes == {
+        "option-1": 1,
+    }
+    poll = await anc_any.talk.close_poll(poll)
+    assert poll.closed is True
+    assert len(poll.details) == 1
+    assert poll.details[0].actor_id == await anc_any.user
+    assert poll.details[0].actor_type == "users"
+    assert poll.details[0].option == 1
+    assert isinstance(poll.details[0].actor_display_name, str)
+    assert str(poll.details[0]).find("actor=") != -1
+
+
+def test_conversation_avatar(nc_any, avatar_png):
     conversation = nc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
     try:
         assert conversation.is_custom_avatar is False
         r = nc_any.talk.get_conversation_avatar(conversation)
         assert isinstance(r, bytes)
-        im = Image.effect_mandelbrot((512, 512), (-3, -2.5, 2, 2.5), 100)
-        buffer = BytesIO()
-        im.save(buffer, format="PNG")
-        buffer.seek(0)
-        r = nc_any.talk.set_conversation_avatar(conversation, buffer.read())
+        r = nc_any.talk.set_conversation_avatar(conversation, avatar_png)
         assert r.is_custom_avatar is True
         r = nc_any.talk.get_conversation_avatar(conversation)
         assert isinstance(r, bytes)
@@ -474,20 +439,13 @@ def test_conversation_avatar(nc_any):
 
 
 @pytest.mark.asyncio(scope="session")
-async def test_conversation_avatar_async(anc_any):
-    if await anc_any.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
+async def test_conversation_avatar_async(anc_any, avatar_png):
     conversation = await anc_any.talk.create_conversation(talk.ConversationType.GROUP, "admin")
     try:
         assert conversation.is_custom_avatar is False
         r = await anc_any.talk.get_conversation_avatar(conversation)
         assert isinstance(r, bytes)
-        im = Image.effect_mandelbrot((512, 512), (-3, -2.5, 2, 2.5), 100)
-        buffer = BytesIO()
-        im.save(buffer, format="PNG")
-        buffer.seek(0)
-        r = await anc_any.talk.set_conversation_avatar(conversation, buffer.read())
+        r = await anc_any.talk.set_conversation_avatar(conversation, avatar_png)
         assert r.is_custom_avatar is True
         r = await anc_any.talk.get_conversation_avatar(conversation)
         assert isinstance(r, bytes)
@@ -503,11 +461,7 @@ async def test_conversation_avatar_async(anc_any):
         await anc_any.talk.delete_conversation(conversation)
 
 
-def test_send_receive_file(nc_client):
-    if nc_client.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
-    nc_second_user = Nextcloud(nc_auth_user=environ["TEST_USER_ID"], nc_auth_pass=environ["TEST_USER_PASS"])
+def test_send_receive_file(nc_client, nc_second_user):
     conversation = nc_client.talk.create_conversation(talk.ConversationType.ONE_TO_ONE, environ["TEST_USER_ID"])
     try:
         r, reference_id = nc_client.talk.send_file("/test_dir/subdir/test_12345_text.txt", conversation)
@@ -541,9 +495,6 @@ def test_send_receive_file(nc_client):
 
 @pytest.mark.asyncio(scope="session")
 async def test_send_receive_file_async(anc_client):
-    if await anc_client.talk.available is False:
-        pytest.skip("Nextcloud Talk is not installed")
-
     nc_second_user = AsyncNextcloud(nc_auth_user=environ["TEST_USER_ID"], nc_auth_pass=environ["TEST_USER_PASS"])
     conversation = await anc_client.talk.create_conversation(talk.ConversationType.ONE_TO_ONE, environ["TEST_USER_ID"])
     try:
@@ -4,39 +4,38 @@ import pytest
 
 from nc_py_api._theming import convert_str_color  # noqa
 
+from ._schema import assert_shape
+
+THEME_COLORS = ("color", "color_text", "color_element", "color_element_bright", "color_element_dark")
+
+THEME_SCHEMA = [
+    ("name", str),
+    ("url", str),
+    ("slogan", str),
+    *((i, tuple) for i in THEME_COLORS),
+    ("logo", str),
+    ("background", str),
+    ("background_plain", bool),
+    ("background_default", bool),
+]
+
 
 def test_get_theme(nc):
     theme = nc.theme
-    assert isinstance(theme["name"], str)
-    assert isinstance(theme["url"], str)
-    assert isinstance(theme["slogan"], str)
-    assert isinstance(theme["color"], tuple)
-    for i in range(3):
-        assert isinstance(theme["color"][i], int)
-    assert isinstance(theme["color_text"], tuple)
-    for i in range(3):
-        assert isinstance(theme["color_text"][i], int)
-    assert isinstance(theme["color_element"], tuple)
-    for i in range(3):
-        assert isinstance(theme["color_element"][i], int)
-    assert isinstance(theme["color_element_bright"], tuple)
-    for i in range(3):
-        assert isinstance(theme["color_element_bright"][i], int)
-    assert isinstance(theme["color_element_dark"], tuple)
-    for i in range(3):
-        assert isinstance(theme["color_element_dark"][i], int)
-    assert isinstance(theme["logo"], str)
-    assert isinstance(theme["background"], str)
-    assert isinstance(theme["background_plain"], bool)
-    assert isinstance(theme["background_default"], bool)
+    assert_shape(theme, THEME_SCHEMA)
+
+
+@pytest.mark.parametrize("key", THEME_COLORS)
+def test_theme_color(nc, key):
+    color = nc.theme[key]
+    assert len(color) == 3
+    assert all(isinstance(i, int) for i in color)
 
 
 @pytest.mark.asyncio(scope="session")
 async def test_get_theme_async(anc_any):
     theme = await anc_any.theme
-    assert isinstance(theme["name"], str)
-    assert isinstance(theme["url"], str)
-    assert isinstance(theme["slogan"], str)
+    assert_shape(theme, THEME_SCHEMA)
 
 
 def test_convert_str_color_values_in(nc_any):
@@ -2,10 +2,16 @@ import pytest
 
 from nc_py_api import FilePermissions, FsNode, NextcloudExceptionNotFound, ex_app
 
+FS_NODE_PERMISSIONS = (
+    ("is_readable", FilePermissions.PERMISSION_READ),
+    ("is_updatable", FilePermissions.PERMISSION_UPDATE),
+    ("is_creatable", FilePermissions.PERMISSION_CREATE),
+    ("is_deletable", FilePermissions.PERMISSION_DELETE),
+    ("is_shareable", FilePermissions.PERMISSION_SHARE),
+)
 
-def test_register_ui_file_actions(nc_app):
-    nc_app.ui.files_dropdown_menu.register_ex("test_ui_action_im", "UI TEST Image", "/ui_action_test", mime="image")
-    result = nc_app.ui.files_dropdown_menu.get_entry("test_ui_action_im")
+
+def _test_ui_action_im(result):
     assert result.name == "test_ui_action_im"
     assert result.display_name == "UI TEST Image"
     assert result.action_handler == "ui_action_test"
@@ -15,9 +21,9 @@ def test_register_ui_file_actions(nc_app):
     assert result.icon == ""
     assert result.appid == "nc_py_api"
     assert result.version == "2.0"
-    nc_app.ui.files_dropdown_menu.unregister(result.name)
-    nc_app.ui.files_dropdown_menu.register("test_ui_action_any", "UI TEST", "ui_action", permissions=1, order=1)
-    result = nc_app.ui.files_dropdown_menu.get_entry("test_ui_action_any")
+
+
+def _test_ui_action_any(result):
     assert result.name == "test_ui_action_any"
     assert result.display_name == "UI TEST"
     assert result.action_handler == "ui_action"
@@ -26,8 +32,9 @@ def test_register_ui_file_actions(nc_app):
     assert result.order == 1
     assert result.icon == ""
     assert result.version == "1.0"
-    nc_app.ui.files_dropdown_menu.register_ex("test_ui_action_any", "UI", "/ui_action2", icon="/img/icon.svg")
-    result = nc_app.ui.files_dropdown_menu.get_entry("test_ui_action_any")
+
+
+def _test_ui_action_any_ex(result):
     assert result.name == "test_ui_action_any"
     assert result.display_name == "UI"
     assert result.action_handler == "ui_action2"
@@ -36,6 +43,19 @@ def test_register_ui_file_actions(nc_app):
     assert result.order == 0
     assert result.icon == "img/icon.svg"
     assert result.version == "2.0"
+
+
+def test_register_ui_file_actions(nc_app):
+    nc_app.ui.files_dropdown_menu.register_ex("test_ui_action_im", "UI TEST Image", "/ui_action_test", mime="image")
+    result = nc_app.ui.files_dropdown_menu.get_entry("test_ui_action_im")
+    _test_ui_action_im(result)
+    nc_app.ui.files_dropdown_menu.unregister(result.name)
+    nc_app.ui.files_dropdown_menu.register("test_ui_action_any", "UI TEST", "ui_action", permissions=1, order=1)
+    result = nc_app.ui.files_dropdown_menu.get_entry("test_ui_action_any")
+    _test_ui_action_any(result)
+    nc_app.ui.files_dropdown_menu.register_ex("test_ui_action_any", "UI", "/ui_action2", icon="/img/icon.svg")
+    result = nc_app.ui.files_dropdown_menu.get_entry("test_ui_action_any")
+    _test_ui_action_any_ex(result)
     nc_app.ui.files_dropdown_menu.unregister(result.name)
     assert str(result).find("name=test_ui_action")
 
@@ -46,36 +66,14 @@ async def test_register_ui_file_actions_async(anc_app):
         "test_ui_action_im", "UI TEST Image", "/ui_action_test", mime="image"
     )
     result = await anc_app.ui.files_dropdown_menu.get_entry("test_ui_action_im")
-    assert result.name == "test_ui_action_im"
-    assert result.display_name == "UI TEST Image"
-    assert result.action_handler == "ui_action_test"
-    assert result.mime == "image"
-    assert result.permissions == 31
-    assert result.order == 0
-    assert result.icon == ""
-    assert result.appid == "nc_py_api"
-    assert result.version == "2.0"
+    _test_ui_action_im(result)
     await anc_app.ui.files_dropdown_menu.unregister(result.name)
     await anc_app.ui.files_dropdown_menu.register("test_ui_action_any", "UI TEST", "ui_action", permissions=1, order=1)
     result = await anc_app.ui.files_dropdown_menu.get_entry("test_ui_action_any")
-    assert result.name == "test_ui_action_any"
-    assert result.display_name == "UI TEST"
-    assert result.action_handler == "ui_action"
-    assert result.mime == "file"
-    assert result.permissions == 1
-    assert result.order == 1
-    assert result.icon == ""
-    assert result.version == "1.0"
+    _test_ui_action_any(result)
     await anc_app.ui.files_dropdown_menu.register_ex("test_ui_action_any", "UI", "/ui_action2", icon="/img/icon.svg")
     result = await anc_app.ui.files_dropdown_menu.get_entry("test_ui_action_any")
-    assert result.name == "test_ui_action_any"
-    assert result.display_name == "UI"
-    assert result.action_handler == "ui_action2"
-    assert result.mime == "file"
-    assert result.permissions == 31
-    assert result.order == 0
-    assert result.icon == "img/icon.svg"
-    assert result.version == "2.0"
+    _test_ui_action_any_ex(result)
     await anc_app.ui.files_dropdown_menu.unregister(result.name)
     assert str(result).find("name=test_ui_action")
 
@@ -101,17 +99,7 @@ async def test_unregister_ui_file_actions_async(anc_app):
 
 def test_ui_file_to_fs_node(nc_app):
     def ui_action_check(directory: str, fs_object: FsNode):
-        permissions = 0
-        if fs_object.is_readable:
-            permissions += FilePermissions.PERMISSION_READ
-        if fs_object.is_updatable:
-            permissions += FilePermissions.PERMISSION_UPDATE
-        if fs_object.is_creatable:
-            permissions += FilePermissions.PERMISSION_CREATE
-        if fs_object.is_deletable:
-            permissions += FilePermissions.PERMISSION_DELETE
-        if fs_object.is_shareable:
-            permissions += FilePermissions.PERMISSION_SHARE
+        permissions = sum(permission for attr, permission in FS_NODE_PERMISSIONS if getattr(fs_object, attr))
         fileid_str = str(fs_object.info.fileid)
         i = fs_object.file_id.find(fileid_str)
         file_info = ex_app.UiActionFileInfo(
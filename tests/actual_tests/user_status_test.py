@@ -77,21 +77,15 @@ def _test_get_predefined(r: list[PredefinedStatus]):
         assert isinstance(i.clear_at, ClearAt) or i.clear_at is None
 
 
+@pytest.mark.require_nc(major=27)
 def test_get_predefined(nc):
-    r = nc.user_status.get_predefined()
-    if nc.srv_version["major"] < 27:
-        assert r == []
-    else:
-        _test_get_predefined(r)
+    _test_get_predefined(nc.user_status.get_predefined())
 
 
 @pytest.mark.asyncio(scope="session")
+@pytest.mark.require_nc(major=27)
 async def test_get_predefined_async(anc):
-    r = await anc.user_status.get_predefined()
-    if (await anc.srv_version)["major"] < 27:
-        assert r == []
-    else:
-        _test_get_predefined(r)
+    _test_get_predefined(await anc.user_status.get_predefined())
 
 
 def test_get_list(nc):
@@ -156,52 +150,54 @@ async def test_set_status_async(anc):
     assert r.status_icon is None
 
 
-@pytest.mark.parametrize("value", ("online", "away", "dnd", "invisible", "offline"))
-def test_set_status_type(nc, value):
-    nc.user_status.set_status_type(value)
-    r = nc.user_status.get_current()
-    assert r.status_type == value
-    assert r.status_type_defined
+def test_set_status_type(nc):
+    for value in ("online", "away", "dnd", "invisible", "offline"):
+        nc.user_status.set_status_type(value)
+        r = nc.user_status.get_current()
+        assert r.status_type == value
+        assert r.status_type_defined, value
 
 
 @pytest.mark.asyncio(scope="session")
-@pytest.mark.parametrize("value", ("online", "away", "dnd", "invisible", "offline"))
-async def test_set_status_type_async(anc, value):
-    await anc.user_status.set_status_type(value)
-    r = await anc.user_status.get_current()
-    assert r.status_type == value
-    assert r.status_type_defined
+async def test_set_status_type_async(anc):
+    for value in ("online", "away", "dnd", "invisible", "offline"):
+        await anc.user_status.set_status_type(value)
+        r = await anc.user_status.get_current()
+        assert r.status_type == value
+        assert r.status_type_defined, value
+
+
+@pytest.fixture(scope="module")
+def predefined_statuses(nc_any) -> list[PredefinedStatus]:
+    """Predefined statuses do not change during the test run, so they are fetched only once."""
+    return nc_any.user_status.get_predefined()
 
 
+@pytest.mark.slow
+@pytest.mark.require_nc(major=27)
 @pytest.mark.parametrize("clear_at", (None, int(time()) + 60 * 60 * 9))
-def test_set_predefined(nc, clear_at):
-    if nc.srv_version["major"] < 27:
-        nc.user_status.set_predefined("meeting")
-    else:
-        predefined_statuses = nc.user_status.get_predefined()
-        for i in predefined_statuses:
-            nc.user_status.set_predefined(i.status_id, clear_at)
-            r = nc.user_status.get_current()
-            assert r.status_message == i.message
-            assert r.status_id == i.status_id
-            assert r.message_predefined
-            assert r.status_clear_at == clear_at
+def test_set_predefined(nc, clear_at, predefined_statuses):
+    for i in predefined_statuses:
+        nc.user_status.set_predefined(i.status_id, clear_at)
+        r = nc.user_status.get_current()
+        assert r.status_message == i.message
+        assert r.status_id == i.status_id
+        assert r.message_predefined
+        assert r.status_clear_at == clear_at
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio(scope="session")
+@pytest.mark.require_nc(major=27)
 @pytest.mark.parametrize("clear_at", (None, int(time()) + 60 * 60 * 9))
-async def test_set_predefined_async(anc, clear_at):
-    if (await anc.srv_version)["major"] < 27:
-        await anc.user_status.set_predefined("meeting")
-    else:
-        predefined_statuses = await anc.user_status.get_predefined()
-        for i in predefined_statuses:
-            await anc.user_status.set_predefined(i.status_id, clear_at)
-            r = await anc.user_status.get_current()
-            assert r.status_message == i.message
-            assert r.status_id == i.status_id
-            assert r.message_predefined
-            assert r.status_clear_at == clear_at
+async def test_set_predefined_async(anc, clear_at, predefined_statuses):
+    for i in predefined_statuses:
+        await anc.user_status.set_predefined(i.status_id, clear_at)
+        r = await anc.user_status.get_current()
+        assert r.status_message == i.message
+        assert r.status_id == i.status_id
+        assert r.message_predefined
+        assert r.status_clear_at == clear_at
 
 
 def test_get_back_status_from_from_empty_user(nc_app):
@@ -7,13 +7,15 @@ import pytest
 from nc_py_api import NextcloudException
 from nc_py_api.users_groups import GroupDetails
 
+from .conftest import unique_name
+
 
 def test_group_get_list(nc, nc_client):
-    groups = nc.users_groups.get_list()
-    assert isinstance(groups, list)
-    assert len(groups) >= 3
-    assert environ["TEST_GROUP_BOTH"] in groups
-    assert environ["TEST_GROUP_USER"] in groups
+    all_groups = nc.users_groups.get_list()
+    assert isinstance(all_groups, list)
+    assert len(all_groups) >= 3
+    assert environ["TEST_GROUP_BOTH"] in all_groups
+    assert environ["TEST_GROUP_USER"] in all_groups
     groups = nc.users_groups.get_list(mask="test_nc_py_api_group")
     assert len(groups) == 2
     groups = nc.users_groups.get_list(limit=1)
@@ -23,11 +25,11 @@ def test_group_get_list(nc, nc_client):
 
 @pytest.mark.asyncio(scope="session")
 async def test_group_get_list_async(anc, anc_client):
-    groups = await anc.users_groups.get_list()
-    assert isinstance(groups, list)
-    assert len(groups) >= 3
-    assert environ["TEST_GROUP_BOTH"] in groups
-    assert environ["TEST_GROUP_USER"] in groups
+    all_groups = await anc.users_groups.get_list()
+    assert isinstance(all_groups, list)
+    assert len(all_groups) >= 3
+    assert environ["TEST_GROUP_BOTH"] in all_groups
+    assert environ["TEST_GROUP_USER"] in all_groups
     groups = await anc.users_groups.get_list(mask="test_nc_py_api_group")
     assert len(groups) == 2
     groups = await anc.users_groups.get_list(limit=1)
@@ -62,6 +64,8 @@ def test_get_non_existing_group(nc_client):
     groups = nc_client.users_groups.get_list(mask="Such group should not be present")
     assert isinstance(groups, list)
     assert not groups
+    with pytest.raises(NextcloudException):
+        nc_client.users_groups.delete("Such group should not be present")
 
 
 @pytest.mark.asyncio(scope="session")
@@ -69,6 +73,8 @@ async def test_get_non_existing_group_async(anc_client):
     groups = await anc_client.users_groups.get_list(mask="Such group should not be present")
     assert isinstance(groups, list)
     assert not groups
+    with pytest.raises(NextcloudException):
+        await anc_client.users_groups.delete("Such group should not be present")
 
 
 def test_group_edit(nc_client):
@@ -98,78 +104,81 @@ async def test_group_edit_async(anc_client):
     )
 
 
-def test_group_display_name_promote_demote(nc_client):
-    group_id = "test_group_display_name_promote_demote"
+@pytest.fixture(scope="module")
+def ephemeral_group(nc_client):
+    """Group with ``12345`` display name and no members, created once for the module."""
+    group_id = unique_name("test_group_display_name_promote_demote")
     with contextlib.suppress(NextcloudException):
         nc_client.users_groups.delete(group_id)
     nc_client.users_groups.create(group_id, display_name="12345")
-    try:
-        group_details = nc_client.users_groups.get_details(mask=group_id)
-        assert len(group_details) == 1
-        assert group_details[0].display_name == "12345"
+    yield group_id
+    nc_client.users_groups.delete(group_id)
 
-        group_members = nc_client.users_groups.get_members(group_id)
-        assert isinstance(group_members, list)
-        assert not group_members
-        group_subadmins = nc_client.users_groups.get_subadmins(group_id)
-        assert isinstance(group_subadmins, list)
-        assert not group_subadmins
 
-        nc_client.users.add_to_group(environ["TEST_USER_ID"], group_id)
+@pytest.mark.slow
+def test_group_display_name_promote_demote(nc_client, ephemeral_group):
+    group_id = ephemeral_group
+    group_details = nc_client.users_groups.get_details(mask=group_id)
+    assert len(group_details) == 1
+    assert group_details[0].display_name == "12345"
+
+    group_members = nc_client.users_groups.get_members(group_id)
+    assert isinstance(group_members, list)
+    assert not group_members
+    group_subadmins = nc_client.users_groups.get_subadmins(group_id)
+    assert isinstance(group_subadmins, list)
+    assert not group_subadmins
+
+    nc_client.users.add_to_group(environ["TEST_USER_ID"], group_id)
+    try:
         group_members = nc_client.users_groups.get_members(group_id)
         assert group_members[0] == environ["TEST_USER_ID"]
         group_subadmins = nc_client.users_groups.get_subadmins(group_id)
         assert not group_subadmins
         nc_client.users.promote_to_subadmin(environ["TEST_USER_ID"], group_id)
-        group_subadmins = nc_client.users_groups.get_subadmins(group_id)
-        assert group_subadmins[0] == environ["TEST_USER_ID"]
-
-        nc_client.users.demote_from_subadmin(environ["TEST_USER_ID"], group_id)
+        try:
+            group_subadmins = nc_client.users_groups.get_subadmins(group_id)
+            assert group_subadmins[0] == environ["TEST_USER_ID"]
+        finally:
+            nc_client.users.demote_from_subadmin(environ["TEST_USER_ID"], group_id)
         group_subadmins = nc_client.users_groups.get_subadmins(group_id)
         assert not group_subadmins
-        nc_client.users.remove_from_group(environ["TEST_USER_ID"], group_id)
-        group_members = nc_client.users_groups.get_members(group_id)
-        assert not group_members
     finally:
-        nc_client.users_groups.delete(group_id)
-        with pytest.raises(NextcloudException):
-            nc_client.users_groups.delete(group_id)
+        nc_client.users.remove_from_group(environ["TEST_USER_ID"], group_id)
+    group_members = nc_client.users_groups.get_members(group_id)
+    assert not group_members
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio(scope="session")
-async def test_group_display_name_promote_demote_async(anc_client):
-    group_id = "test_group_display_name_promote_demote"
-    with contextlib.suppress(NextcloudException):
-        await anc_client.users_groups.delete(group_id)
-    await anc_client.users_groups.create(group_id, display_name="12345")
+async def test_group_display_name_promote_demote_async(anc_client, ephemeral_group):
+    group_id = ephemeral_group
+    group_details = await anc_client.users_groups.get_details(mask=group_id)
+    assert len(group_details) == 1
+    assert group_details[0].display_name == "12345"
+
+    group_members = await anc_client.users_groups.get_members(group_id)
+    assert isinstance(group_members, list)
+    assert not group_members
+    group_subadmins = await anc_client.users_groups.get_subadmins(group_id)
+    assert isinstance(group_subadmins, list)
+    assert not group_subadmins
+
+    await anc_client.users.add_to_group(environ["TEST_USER_ID"], group_id)
     try:
-        group_details = await anc_client.users_groups.get_details(mask=group_id)
-        assert len(group_details) == 1
-        assert group_details[0].display_name == "12345"
-
-        group_members = await anc_client.users_groups.get_members(group_id)
-        assert isinstance(group_members, list)
-        assert not group_members
-        group_subadmins = await anc_client.users_groups.get_subadmins(group_id)
-        assert isinstance(group_subadmins, list)
-        assert not group_subadmins
-
-        await anc_client.users.add_to_group(environ["TEST_USER_ID"], group_id)
         group_members = await anc_client.users_groups.get_members(group_id)
         assert group_members[0] == environ["TEST_USER_ID"]
         group_subadmins = await anc_client.users_groups.get_subadmins(group_id)
         assert not group_subadmins
         await anc_client.users.promote_to_subadmin(environ["TEST_USER_ID"], group_id)
-        group_subadmins = await anc_client.users_groups.get_subadmins(group_id)
-        assert group_subadmins[0] == environ["TEST_USER_ID"]
-
-        await anc_client.users.demote_from_subadmin(environ["TEST_USER_ID"], group_id)
+        try:
+            group_subadmins = await anc_client.users_groups.get_subadmins(group_id)
+            assert group_subadmins[0] == environ["TEST_USER_ID"]
+        finally:
+            await anc_client.users.demote_from_subadmin(environ["TEST_USER_ID"], group_id)
         group_subadmins = await anc_client.users_groups.get_subadmins(group_id)
         assert not group_subadmins
-        await anc_client.users.remove_from_group(environ["TEST_USER_ID"], group_id)
-        group_members = await anc_client.users_groups.get_members(group_id)
-        assert not group_members
     finally:
-        await anc_client.users_groups.delete(group_id)
-        with pytest.raises(NextcloudException):
-            await anc_client.users_groups.delete(group_id)
+        await anc_client.users.remove_from_group(environ["TEST_USER_ID"], group_id)
+    group_members = await anc_client.users_groups.get_members(group_id)
+    assert not group_members
@@ -14,6 +14,8 @@ from nc_py_api import (
     users,
 )
 
+from .conftest import unique_name
+
 
 def _test_get_user_info(admin: users.UserInfo, current_user: users.UserInfo):
     for i in (
@@ -54,12 +56,14 @@ def _test_get_user_info(admin: users.UserInfo, current_user: users.UserInfo):
     assert str(admin).find("last_login=") != -1
 
 
+@pytest.mark.xdist_group("admin_profile")
 def test_get_user_info(nc):
     admin = nc.users.get_user("admin")
     current_user = nc.users.get_user()
     _test_get_user_info(admin, current_user)
 
 
+@pytest.mark.xdist_group("admin_profile")
 @pytest.mark.asyncio(scope="session")
 async def test_get_user_info_async(anc):
     admin = await anc.users.get_user("admin")
@@ -119,9 +123,7 @@ async def test_create_user_with_groups_async(anc_client):
 
 
 def test_create_user_no_name_mail(nc_client):
-    test_user_name = "test_create_user_no_name_mail"
-    with contextlib.suppress(NextcloudException):
-        nc_client.users.delete(test_user_name)
+    test_user_name = "test_create_user_no_name_mail"  # arguments are validated before any request is sent
     with pytest.raises(ValueError):
         nc_client.users.create(test_user_name)
     with pytest.raises(ValueError):
@@ -132,9 +134,7 @@ def test_create_user_no_name_mail(nc_client):
 
 @pytest.mark.asyncio(scope="session")
 async def test_create_user_no_name_mail_async(anc_client):
-    test_user_name = "test_create_user_no_name_mail"
-    with contextlib.suppress(NextcloudException):
-        await anc_client.users.delete(test_user_name)
+    test_user_name = "test_create_user_no_name_mail"  # arguments are validated before any request is sent
     with pytest.raises(ValueError):
         await anc_client.users.create(test_user_name)
     with pytest.raises(ValueError):
@@ -143,8 +143,9 @@ async def test_create_user_no_name_mail_async(anc_client):
         await anc_client.users.create(test_user_name, email="")
 
 
+@pytest.mark.xdist_group("user_list")
 def test_delete_user(nc_client):
-    test_user_name = "test_delete_user"
+    test_user_name = unique_name("test_delete_user")
     with contextlib.suppress(NextcloudException):
         nc_client.users.create(test_user_name, password="az1dcaNG4c42")
     nc_client.users.delete(test_user_name)
@@ -152,9 +153,10 @@ def test_delete_user(nc_client):
         nc_client.users.delete(test_user_name)
 
 
+@pytest.mark.xdist_group("user_list")
 @pytest.mark.asyncio(scope="session")
 async def test_delete_user_async(anc_client):
-    test_user_name = "test_delete_user"
+    test_user_name = unique_name("test_delete_user")
     with contextlib.suppress(NextcloudException):
         await anc_client.users.create(test_user_name, password="az1dcaNG4c42")
     await anc_client.users.delete(test_user_name)
@@ -162,6 +164,7 @@ async def test_delete_user_async(anc_client):
         await anc_client.users.delete(test_user_name)
 
 
+@pytest.mark.xdist_group("user_list")
 def test_users_get_list(nc, nc_client):
     _users = nc.users.get_list()
     assert isinstance(_users, list)
@@ -175,6 +178,7 @@ def test_users_get_list(nc, nc_client):
     assert len(_users) == 1
 
 
+@pytest.mark.xdist_group("user_list")
 @pytest.mark.asyncio(scope="session")
 async def test_users_get_list_async(anc, anc_client):
     _users = await anc.users.get_list()
@@ -189,27 +193,31 @@ async def test_users_get_list_async(anc, anc_client):
     assert len(_users) == 1
 
 
-def test_enable_disable_user(nc_client):
-    test_user_name = "test_enable_disable_user"
+@pytest.fixture(scope="module")
+def ephemeral_user(nc_client):
+    """User that nobody logs in as, created once for the module."""
+    user_id = unique_name("test_enable_disable_user")
     with contextlib.suppress(NextcloudException):
-        nc_client.users.create(test_user_name, password="az1dcaNG4c42")
-    nc_client.users.disable(test_user_name)
-    assert nc_client.users.get_user(test_user_name).enabled is False
-    nc_client.users.enable(test_user_name)
-    assert nc_client.users.get_user(test_user_name).enabled is True
-    nc_client.users.delete(test_user_name)
+        nc_client.users.create(user_id, password="az1dcaNG4c42")
+    yield user_id
+    nc_client.users.delete(user_id)
+
+
+@pytest.mark.xdist_group("user_list")
+def test_enable_disable_user(nc_client, ephemeral_user):
+    nc_client.users.disable(ephemeral_user)
+    assert nc_client.users.get_user(ephemeral_user).enabled is False
+    nc_client.users.enable(ephemeral_user)
+    assert nc_client.users.get_user(ephemeral_user).enabled is True
 
 
+@pytest.mark.xdist_group("user_list")
 @pytest.mark.asyncio(scope="session")
-async def test_enable_disable_user_async(anc_client):
-    test_user_name = "test_enable_disable_user"
-    with contextlib.suppress(NextcloudException):
-        await anc_client.users.create(test_user_name, password="az1dcaNG4c42")
-    await anc_client.users.disable(test_user_name)
-    assert (await anc_client.users.get_user(test_user_name)).enabled is False
-    await anc_client.users.enable(test_user_name)
-    assert (await anc_client.users.get_user(test_user_name)).enabled is True
-    await anc_client.users.delete(test_user_name)
+async def test_enable_disable_user_async(anc_client, ephemeral_user):
+    await anc_client.users.disable(ephemeral_user)
+    assert (await anc_client.users.get_user(ephemeral_user)).enabled is False
+    await anc_client.users.enable(ephemeral_user)
+    assert (await anc_client.users.get_user(ephemeral_user)).enabled is True
 
 
 def test_user_editable_fields(nc):
@@ -225,6 +233,7 @@ async def test_user_editable_fields_async(anc):
     assert editable_fields
 
 
+@pytest.mark.xdist_group("admin_profile")
 def test_edit_user(nc_client):
     nc_client.users.edit(nc_client.user, address="Le Pame", email="admino@gmx.net")
     current_user = nc_client.users.get_user()
@@ -236,6 +245,7 @@ def test_edit_user(nc_client):
     assert current_user.email == "admin@gmx.net"
 
 
+@pytest.mark.xdist_group("admin_profile")
 @pytest.mark.asyncio(scope="session")
 async def test_edit_user_async(anc_client):
     await anc_client.users.edit(await anc_client.user, address="Le Pame", email="admino@gmx.net")
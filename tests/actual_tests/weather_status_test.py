@@ -2,6 +2,8 @@ import pytest
 
 from nc_py_api import NextcloudException, weather_status
 
+pytestmark = pytest.mark.xdist_group("weather_location")  # all tests here change the same user's location
+
 
 def test_available(nc):
     assert nc.weather_status.available
@@ -14,16 +16,11 @@ async def test_available_async(anc):
 
 def test_get_set_location(nc_any):
     try:
-        nc_any.weather_status.set_location(longitude=0.0, latitude=0.0)
+        assert nc_any.weather_status.set_location(longitude=0.0, latitude=0.0)  # 0.0 is a valid coordinate
     except NextcloudException as e:
         if e.status_code in (408, 500, 996):
             pytest.skip("Some network problem on the host")
         raise e from None
-    loc = nc_any.weather_status.get_location()
-    assert loc.latitude == 0.0
-    assert loc.longitude == 0.0
-    assert isinstance(loc.address, str)
-    assert isinstance(loc.mode, int)
     try:
         assert nc_any.weather_status.set_location(address="Paris, 75007, France")
     except NextcloudException as e:
@@ -40,6 +37,7 @@ def test_get_set_location(nc_any):
     loc = nc_any.weather_status.get_location()
     assert loc.latitude == 41.896655
     assert loc.longitude == 12.488776
+    assert isinstance(loc.mode, int)
     if loc.address.find("Unknown") != -1:
         pytest.skip("Some network problem on the host")
     assert loc.address.find("Rom") != -1
@@ -48,16 +46,11 @@ def test_get_set_location(nc_any):
 @pytest.mark.asyncio(scope="session")
 async def test_get_set_location_async(anc_any):
     try:
-        await anc_any.weather_status.set_location(longitude=0.0, latitude=0.0)
+        assert await anc_any.weather_status.set_location(longitude=0.0, latitude=0.0)  # 0.0 is a valid coordinate
     except NextcloudException as e:
         if e.status_code in (408, 500, 996):
             pytest.skip("Some network problem on the host")
         raise e from None
-    loc = await anc_any.weather_status.get_location()
-    assert loc.latitude == 0.0
-    assert loc.longitude == 0.0
-    assert isinstance(loc.address, str)
-    assert isinstance(loc.mode, int)
     try:
         assert await anc_any.weather_status.set_location(address="Paris, 75007, France")
     except NextcloudException as e:
@@ -74,6 +67,7 @@ async def test_get_set_location_async(anc_any):
     loc = await anc_any.weather_status.get_location()
     assert loc.latitude == 41.896655
     assert loc.longitude == 12.488776
+    assert isinstance(loc.mode, int)
     if loc.address.find("Unknown") != -1:
         pytest.skip("Some network problem on the host")
     assert loc.address.find("Rom") != -1
@@ -92,9 +86,9 @@ async def test_get_set_location_no_lat_lon_address_async(anc):
 
 def test_get_forecast(nc_any):
     nc_any.weather_status.set_location(latitude=41.896655, longitude=12.488776)
-    if nc_any.weather_status.get_location().address.find("Unknown") != -1:
-        pytest.skip("Some network problem on the host")
     forecast = nc_any.weather_status.get_forecast()
+    if not forecast and nc_any.weather_status.get_location().address.find("Unknown") != -1:
+        pytest.skip("Some network problem on the host")
     assert isinstance(forecast, list)
     assert forecast
     assert isinstance(forecast[0], dict)
@@ -103,33 +97,31 @@ def test_get_forecast(nc_any):
 @pytest.mark.asyncio(scope="session")
 async def test_get_forecast_async(anc_any):
     await anc_any.weather_status.set_location(latitude=41.896655, longitude=12.488776)
-    if (await anc_any.weather_status.get_location()).address.find("Unknown") != -1:
-        pytest.skip("Some network problem on the host")
     forecast = await anc_any.weather_status.get_forecast()
+    if not forecast and (await anc_any.weather_status.get_location()).address.find("Unknown") != -1:
+        pytest.skip("Some network problem on the host")
     assert isinstance(forecast, list)
     assert forecast
     assert isinstance(forecast[0], dict)
 
 
 def test_get_set_favorites(nc):
-    nc.weather_status.set_favorites([])
+    assert nc.weather_status.set_favorites([])
+    assert nc.weather_status.set_favorites(["Paris, France", "Madrid, Spain"])
     r = nc.weather_status.get_favorites()
     assert isinstance(r, list)
-    assert not r
-    nc.weather_status.set_favorites(["Paris, France", "Madrid, Spain"])
-    r = nc.weather_status.get_favorites()
+    assert len(r) == 2  # the list is replaced, not extended
     assert any("Paris" in x for x in r)
     assert any("Madrid" in x for x in r)
 
 
 @pytest.mark.asyncio(scope="session")
 async def test_get_set_favorites_async(anc):
-    await anc.weather_status.set_favorites([])
+    assert await anc.weather_status.set_favorites([])
+    assert await anc.weather_status.set_favorites(["Paris, France", "Madrid, Spain"])
     r = await anc.weather_status.get_favorites()
     assert isinstance(r, list)
-    assert not r
-    await anc.weather_status.set_favorites(["Paris, France", "Madrid, Spain"])
-    r = await anc.weather_status.get_favorites()
+    assert len(r) == 2  # the list is replaced, not extended
     assert any("Paris" in x for x in r)
     assert any("Madrid" in x for x in r)
 
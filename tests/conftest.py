@@ -111,15 +111,18 @@ def pytest_generate_tests(metafunc):
 
 
 def pytest_collection_modifyitems(items):
+    srv_ver = None
     for item in items:
         require_nc = [i for i in item.own_markers if i.name == "require_nc"]
         if require_nc:
             min_major = require_nc[0].kwargs["major"]
             min_minor = require_nc[0].kwargs.get("minor", 0)
-            srv_ver = NC_APP.srv_version if NC_APP else NC_CLIENT.srv_version
-            if srv_ver["major"] < min_major:
+            if srv_ver is None:  # read once, and only when some collected test has the marker
+                srv_version = NC_APP.srv_version if NC_APP else NC_CLIENT.srv_version
+                srv_ver = (srv_version["major"], srv_version["minor"])
+            if srv_ver[0] < min_major:
                 item.add_marker(pytest.mark.skip(reason=f"Need NC>={min_major}"))
-            elif srv_ver["major"] == min_major and srv_ver["minor"] < min_minor:
+            elif srv_ver < (min_major, min_minor):
                 item.add_marker(pytest.mark.skip(reason=f"Need NC>={min_major}.{min_minor}"))
 
 